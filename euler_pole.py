@@ -17,12 +17,8 @@
 #  Goudarzi, M. A., Cocard, M. & Santerre, R. (2014), EPC: Matlab software to estimate Euler
 #    pole parameters, GPS Solutions, 18, 153-162, doi: 10.1007/s10291-013-0354-4
 
-import collections
-import os
-
 import numpy as np
 import pyproj
-from shapely import geometry
 
 
 # global variables
@@ -15,7 +15,8 @@
 import numpy as np
 from skimage.transform import resize
 
-from euler_pole import ITRF2014_PMM, EulerPole
+from euler_pole import EulerPole
+from models import ITRF2014_PMM
 
 # original mintpy dependency
 from mintpy.diff import diff_file
@@ -1,22 +1,164 @@
+import functools
 import os
+
 import numpy as np
 
 from shapely import geometry
 
-import matplotlib.pyplot as plt
-from cartopy import crs as ccrs, feature as cfeature
+from models import (
+    GSRM_V21_ABBREV2NAME,
+    GSRM_V21_PMM,
+    NNR_MORVEL56_ABBREV2NAME,
+    NNR_MORVEL56_PMM,
+    PLATE_BOUNDARY_ABBREV_ALIAS,
+    PLATE_BOUNDARY_FILE,
+)
+
+try:
+    # shapely>=2.0
+    from shapely import contains_xy, prepare
+except ImportError:
+    # shapely<2.0, vectorized.contains prepares the geometry internally
+    from shapely.vectorized import contains as contains_xy
+    prepare = None
 
 ####################################  Utility for plotting  ##############################################
 # Utility for plotting the plate motion on a globe
 # check usage: https://github.com/yuankailiu/utils/blob/main/notebooks/PMM_plot.ipynb
 # Later will be moved to a separate script `plot_utils.py` in plate motion package
 
+# loop over points, replaced by numba.prange in _get_contains_points()
+prange = range
+
+
+def _contains_points(verts, pts, out):
+    """Test whether points are inside a polygon, via the crossing number (ray casting) algorithm.
+
+    Parameters: verts - 2D np.ndarray in float64 in size of (num_vertex, 2), polygon vertices
+                pts   - 2D np.ndarray in float64 in size of (num_point, 2), points of interest
+                out   - 1D np.ndarray in bool in size of (num_point,), True for points inside polygon
+    """
+    num_vert = verts.shape[0]
+    for i in prange(pts.shape[0]):
+        x, y = pts[i, 0], pts[i, 1]
+        inside = False
+        j = num_vert - 1
+        for k in range(num_vert):
+            # whether the horizontal ray from the point crosses the edge (k, j)
+            if (verts[k, 1] > y) != (verts[j, 1] > y):
+                x_cross = (verts[j, 0] - verts[k, 0]) * (y - verts[k, 1]) / (verts[j, 1] - verts[k, 1]) + verts[k, 0]
+                if x < x_cross:
+                    inside = not inside
+            j = k
+        out[i] = inside
+
+
+@functools.lru_cache(maxsize=None)
+def _get_contains_points():
+    """Compile _contains_points() via numba in parallel (optional, imported on demand for its import cost).
+
+    Returns: func - numba compiled _contains_points(), None if numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    global prange
+    prange = numba.prange
+    return numba.njit(cache=True, parallel=True)(_contains_points)
+
+# minimum number of points to use the compiled _contains_points() over shapely, None to disable.
+# Opt-in only: the prepared shapely test is ~10x faster than the compiled kernel on a single core
+# (1M points in Africa: 163 ms vs. 1339 ms), the kernel may only pay off with many cores.
+NUMBA_MIN_NUM_POINT = None
+
+
+# parsed plate boundary files, cached until the file is modified
+# {plate_boundary_file: {'mtime': float, 'outlines': {plate_abbrev: vertices}, 'complete': bool}}
+_OUTLINES_CACHE = {}
+
+
+def _load_outlines(plate_boundary_file, coord_order, mtime, abbrev_alias=None, plate_abbrev=None):
+    """Parse the plate boundary file into vertices for all plates (or the given plate only).
+
+    The parsed plates are cached: a single plate is taken from the cache if available (e.g., after
+    reading all plates), otherwise only parsed until the end of that plate and then cached.
+
+    Parameters: plate_boundary_file - str, path to the plate boundary file in GMT format
+                coord_order         - str, lat/lon order of the vertices in the file, lalo or lola
+                mtime               - float, file modification time, to invalidate the cache
+                abbrev_alias        - dict, {abbrev_in_file: plate_abbrev} for plates named differently
+                plate_abbrev        - str, plate abbreviation of interest (upper case), read all plates if None
+    Returns:    outlines            - dict, {plate_abbrev: 2D np.ndarray of vertices in lat/lon} (read-only)
+    """
+    def _parse_vertices(vert_lines):
+        """Parse all vertex lines of a plate in one pass, into a 2D np.ndarray in lat/lon."""
+        vertices = np.fromstring(''.join(vert_lines), dtype=np.float64, sep=' ').reshape(-1, 2)
+        if coord_order == 'lola':
+            vertices = vertices[:, ::-1]
+        # read-only, as the arrays are cached and shared by all callers
+        vertices.setflags(write=False)
+        return vertices
+
+    # read from the cache
+    cache = _OUTLINES_CACHE.get(plate_boundary_file)
+    if cache is None or cache['mtime'] != mtime:
+        cache = {'mtime': mtime, 'outlines': {}, 'complete': False}
+        _OUTLINES_CACHE[plate_boundary_file] = cache
+
+    if plate_abbrev and (plate_abbrev in cache['outlines'] or cache['complete']):
+        return {key: val for key, val in cache['outlines'].items() if key == plate_abbrev}
+    elif not plate_abbrev and cache['complete']:
+        return dict(cache['outlines'])
+
+    # read from the file
+    abbrev_alias = abbrev_alias or {}
+    outlines = {}
+    with open(plate_boundary_file) as f:
+        key, vert_lines = None, None
+        # loop over lines to read (streaming from the file)
+        for line in f:
+            # whether we meet a new plate name abbreviation
+            # as "> XX" or "# XX" (GSRM) or "XX" (MORVEL), while vertex lines start with space/sign/digit
+            head = line[:2]
+            is_prefixed = head in ('> ', '# ')
+            if is_prefixed or line[:1].isalpha():
+                # whether to add the previous plate to the dictionary
+                if key and vert_lines:
+                    outlines[key] = _parse_vertices(vert_lines)
+                    # stop parsing once the plate of interest is read
+                    if plate_abbrev:
+                        break
+                # identify the new plate name abbreviation (without the line change string)
+                key = line[2:].strip() if is_prefixed else line.strip()
+                key = abbrev_alias.get(key, key.upper())
+                # new vertices for the new plate (skip plates not of interest)
+                vert_lines = [] if not plate_abbrev or key == plate_abbrev else None
+
+            # get plate outline vertices
+            # (collect the raw lines, to be parsed in bulk for each plate)
+            elif vert_lines is not None:
+                vert_lines.append(line)
+
+        # add the last plate to the dictionary
+        if key and vert_lines and key not in outlines:
+            outlines[key] = _parse_vertices(vert_lines)
+
+    # save to the cache
+    cache['outlines'].update(outlines)
+    cache['complete'] = cache['complete'] or not plate_abbrev
+
+    return outlines
+
+
 def read_plate_outline(pmm_name='GSRM', plate_name=None):
     """Read the plate boundaries for the given plate motion model.
 
     Paramters: pmm_name   - str, plate motion (model) name
                plate_name - str, plate name of interest, return all plates if None
-    Returns:   outline    - dict, a dictionary that contains lists of vertices in lat/lon for all plates
+    Returns:   outline    - dict, a dictionary that contains arrays of vertices in lat/lon for all plates
+                            (copies of the cached ones, free to modify)
                             OR shapely.geometry.polygon.Polygon object, boundary of the given "plate".
     """
 
@@ -24,10 +166,12 @@ def read_plate_outline(pmm_name='GSRM', plate_name=None):
     if 'GSRM' in pmm_name:
         pmm_name = 'GSRM'
         pmm_dict = GSRM_V21_PMM
+        plate_abbrev2name = GSRM_V21_ABBREV2NAME
 
     elif 'MORVEL' in pmm_name:
         pmm_name = 'MORVEL'
         pmm_dict = NNR_MORVEL56_PMM
+        plate_abbrev2name = NNR_MORVEL56_ABBREV2NAME
 
     else:
         msg = f'Un-recognized plate motion model: {pmm_name}!'
@@ -35,65 +179,65 @@ def read_plate_outline(pmm_name='GSRM', plate_name=None):
         raise ValueError(msg)
 
     # plate boundary file
-    plate_boundary_file = PLATE_BOUNDARY_FILE[pmm_name]
+    plate_boundary_file = os.fspath(PLATE_BOUNDARY_FILE[pmm_name])
     coord_order = os.path.basename(plate_boundary_file).split('.')[-1]
     if coord_order not in ['lalo', 'lola']:
         raise ValueError(f'Can NOT recognize the lat/lon order from the file extension: .{coord_order}!')
 
-    # dict to convert plate abbreviation to name
-    plate_abbrev2name = {}
-    for key, val in pmm_dict.items():
-        plate_abbrev2name[val.Abbrev.upper()] = key
-
-    # read the plate outlines file, save them to a dictionary {plate_A: [vertices], ..., ..., ...}
-    outlines = {}
-    with open(plate_boundary_file) as f:
-        lines = f.readlines()
-        key, vertices = None, None
-        # loop over lines to read
-        for line in lines:
-            # whether we meet a new plate name abbreviation
-            if line.startswith('> ') or line.startswith('# ') or len(line.split()) == 1:
-                # whether to add the previous plate to the dictionary
-                if key and vertices:
-                    pname = plate_abbrev2name[key]
-                    outlines[pname] = np.array(vertices)
-                # identify the new plate name abbreviation
-                if line.startswith('> '):
-                    key = line.split('> ')[1]
-                elif line.startswith('# '):
-                    key = line.split('# ')[1]
-                else:
-                    key = str(line)
-                # remove the line change string
-                if key.endswith('\n'):
-                    key = key.split('\n')[0]
-                # new vertices for the new plate
-                vertices = []
-
-            # get plate outline vertices
-            else:
-                vert = np.array(line.split()).astype(float)
-                if coord_order == 'lola':
-                    vert = np.flip(vert)
-                vertices.append(vert)
+    # read the plate outlines file (cached until the file is modified)
+    mtime = os.path.getmtime(plate_boundary_file)
+    abbrev_alias = PLATE_BOUNDARY_ABBREV_ALIAS[pmm_name]
 
     # outline of a specific plate
     if plate_name:
-        if plate_name not in plate_abbrev2name.values():
-            plate_abbrev = pmm_dict[plate_name].Abbrev
+        if plate_name not in pmm_dict.keys():
+            raise ValueError(f'Un-recognized plate name: {plate_name} in plate motion model: {pmm_name}!')
+
+        # read the given plate only
+        plate_abbrev = pmm_dict[plate_name].Abbrev
+        outlines = _load_outlines(plate_boundary_file, coord_order, mtime, abbrev_alias=abbrev_alias,
+                                  plate_abbrev=plate_abbrev.upper())
+        if plate_abbrev.upper() not in outlines:
             raise ValueError(f'Can NOT found plate {plate_name} ({plate_abbrev}) in file: {plate_boundary_file}!')
 
         # convert list into shapely polygon object
         # for easy use
-        outline = geometry.Polygon(outlines[plate_name])
+        outline = geometry.Polygon(outlines[plate_abbrev.upper()])
 
     else:
-        outline = outlines
+        # save all plates to a dictionary {plate_A: [vertices], ..., ..., ...}
+        # copy the (read-only) cached vertices, to keep the cache intact from in-place changes by the caller
+        outline = {}
+        for key, vertices in _load_outlines(plate_boundary_file, coord_order, mtime, abbrev_alias=abbrev_alias).items():
+            outline[plate_abbrev2name[key]] = vertices.copy()
 
     return outline
 
 
+def _polygon_lalo2lola(poly_coords):
+    """Convert the plate polygon vertices in lat/lon into lon/lat geometries for cartopy.
+
+    Longitudes are unwrapped to be continuous across the antimeridian (to avoid edges spanning
+    ~360 deg in longitude), and polygons around a pole (i.e., with a net longitude change of 360 deg)
+    are closed via that pole.
+
+    Parameters: poly_coords - 2D np.ndarray in size of (num_vertex, 2), polygon vertices in lat/lon
+    Returns:    polygon     - shapely.geometry.Polygon object in lon/lat
+                boundary    - shapely.geometry.LineString object in lon/lat, plate boundary without
+                              the edges via the pole, None if the polygon does NOT contain a pole
+    """
+    lats, lons = poly_coords.T
+    lons = np.rad2deg(np.unwrap(np.deg2rad(lons)))
+    if abs(lons[-1] - lons[0]) <= 180:
+        return geometry.Polygon(np.column_stack([lons, lats])), None
+
+    boundary = geometry.LineString(np.column_stack([lons, lats]))
+    pole_lat = 90. if np.mean(lats) > 0 else -90.
+    lats = np.concatenate([lats, [pole_lat, pole_lat]])
+    lons = np.concatenate([lons, [lons[-1], lons[0]]])
+    return geometry.Polygon(np.column_stack([lons, lats])), boundary
+
+
 def plot_plate_motion(plate_boundary, epole_obj, center_lalo=None, qscale=200, qunit=50,
                       satellite_height=1e6, figsize=[5, 5], **kwargs):
     """Plot the globe map wityh plate boundary, quivers on some points.
@@ -104,7 +248,9 @@ def plot_plate_motion(plate_boundary, epole_obj, center_lalo=None, qscale=200, q
                 qscale           - float, scaling factor of the quiver
                 qunit            - float, length of the quiver legend in mm/yr
                 satellite_height - height of the perspective view looking in meters
-                kwargs           - dict, dictionary for plotting
+                kwargs           - dict, dictionary for plotting, e.g.:
+                                   center_method - str, map center from the plate boundary if center_lalo
+                                                   and pts_lalo are None: mean (of vertices, default) or centroid
     Returns:    fig, ax          - matplotlib figure and axes objects
     Examples:
         from matplotlib import pyplot as plt
@@ -122,31 +268,49 @@ def plot_plate_motion(plate_boundary, epole_obj, center_lalo=None, qscale=200, q
         fig, ax = euler_pole.plot_plate_motion(plate_boundary, epole_obj)
         plt.show()
     """
+    # import plotting modules here, to avoid the slow import for using the plate outlines only
+    import matplotlib.pyplot as plt
+    from matplotlib import colors as mcolors
+    from cartopy import crs as ccrs, feature as cfeature
 
-    def _sample_coords_within_polygon(polygon_obj, ny=10, nx=10):
+    def _sample_coords_within_polygon(polygon_obj, poly_coords, ny=10, nx=10):
         """Make a set of points inside the defined sphericalpolygon object.
 
         Parameters: polygon_obj - shapely.geometry.Polygon, a polygon object in lat/lon.
+                    poly_coords - 2D np.ndarray, exterior vertices of polygon_obj in lat/lon.
                     ny          - int, number of intial sample points in the y (lat) direction.
                     nx          - int, number of intial sample points in the x (lon) direction.
         Returns:    sample_lats - 1D np.ndarray, sample coordinates   in the y (lat) direction.
                     sample_lons - 1D np.ndarray, sample coordinates   in the x (lon) direction.
         """
         # generate sample point grid
-        poly_lats = np.array(polygon_obj.exterior.coords)[:,0]
-        poly_lons = np.array(polygon_obj.exterior.coords)[:,1]
-        cand_lats, cand_lons = np.meshgrid(
-            np.linspace(np.min(poly_lats), np.max(poly_lats), ny),
-            np.linspace(np.min(poly_lons), np.max(poly_lons), nx),
-        )
-        cand_lats = cand_lats.flatten()
-        cand_lons = cand_lons.flatten()
+        poly_lats, poly_lons = poly_coords.T
+        # (flattened grid built directly from the 1D axes, same order as np.meshgrid)
+        cand_lats = np.tile(np.linspace(np.min(poly_lats), np.max(poly_lats), ny), nx)
+        cand_lons = np.repeat(np.linspace(np.min(poly_lons), np.max(poly_lons), nx), ny)
+
+        # pre-select points strictly inside the polygon bounding box
+        # as points on the box edges (the outermost grid rows/columns) can NOT be inside the polygon
+        min_lat, min_lon, max_lat, max_lon = polygon_obj.bounds
+        flag = (  (cand_lats > min_lat) & (cand_lats < max_lat)
+                & (cand_lons > min_lon) & (cand_lons < max_lon))
 
         # select points inside the polygon
-        flag = np.zeros(cand_lats.size, dtype=np.bool_)
-        for i, (cand_lat, cand_lon) in enumerate(zip(cand_lats, cand_lons)):
-            if polygon_obj.contains(geometry.Point(cand_lat, cand_lon)):
-                flag[i] = True
+        contains_points = None
+        if NUMBA_MIN_NUM_POINT is not None and np.count_nonzero(flag) >= NUMBA_MIN_NUM_POINT:
+            contains_points = _get_contains_points()
+
+        if contains_points is not None:
+            # via the compiled ray casting test on the polygon vertices, for many points
+            pts = np.column_stack([cand_lats[flag], cand_lons[flag]])
+            inside = np.zeros(pts.shape[0], dtype=np.bool_)
+            contains_points(np.ascontiguousarray(poly_coords, dtype=np.float64), pts, inside)
+            flag[flag] = inside
+        else:
+            # via one vectorized test on the prepared polygon, instead of one shapely call per point
+            if prepare is not None:
+                prepare(polygon_obj)
+            flag[flag] = contains_xy(polygon_obj, cand_lats[flag], cand_lons[flag])
         sample_lats = cand_lats[flag]
         sample_lons = cand_lons[flag]
 
@@ -164,6 +328,10 @@ def plot_plate_motion(plate_boundary, epole_obj, center_lalo=None, qscale=200, q
     kwargs['grid_lw']     = kwargs.get('grid_lw', 0.3)
     kwargs['grid_lc']     = kwargs.get('grid_lc', 'gray')
     kwargs['qnum']        = kwargs.get('qnum', 6)
+    # map center from the plate boundary: mean (of vertices) or centroid
+    kwargs['center_method'] = kwargs.get('center_method', 'mean')
+    if kwargs['center_method'] not in ['mean', 'centroid']:
+        raise ValueError(f"Un-recognized center_method: {kwargs['center_method']}! Available: mean, centroid.")
     # point of interest
     kwargs['pts_lalo']    = kwargs.get('pts_lalo', None)
     kwargs['pts_marker']  = kwargs.get('pts_marker', '^')
@@ -172,13 +340,26 @@ def plot_plate_motion(plate_boundary, epole_obj, center_lalo=None, qscale=200, q
     kwargs['pts_mec']     = kwargs.get('pts_mec', 'k')
     kwargs['pts_mew']     = kwargs.get('pts_mew', 1)
 
+    # vertices of the plate boundary in lat/lon (converted once for all usages below)
+    # and the plate polygon in lon/lat for cartopy (unwrapped across the antimeridian)
+    if plate_boundary:
+        poly_coords = np.asarray(plate_boundary.exterior.coords)
+        plate_polygon, pole_boundary = _polygon_lalo2lola(poly_coords)
+
     # map projection
     # based on: 1) map center and 2) satellite_height
     if not center_lalo:
         if kwargs['pts_lalo']:
             center_lalo = kwargs['pts_lalo']
+        elif kwargs['center_method'] == 'centroid':
+            # area-weighted centroid of the plate (on the unwrapped polygon)
+            center_lon, center_lat = plate_polygon.centroid.coords[0]
+            center_lalo = [center_lat, (center_lon + 180) % 360 - 180]
         else:
-            center_lalo = np.array(plate_boundary.centroid.coords)[0]
+            # mean of the plate vertices (excluding the closing one), cheaper than centroid
+            # (on the unwrapped longitudes, to be continuous across the antimeridian)
+            center_lon = np.rad2deg(np.unwrap(np.deg2rad(poly_coords[:-1, 1]))).mean()
+            center_lalo = [poly_coords[:-1, 0].mean(), (center_lon + 180) % 360 - 180]
     map_proj = ccrs.NearsidePerspective(center_lalo[1], center_lalo[0], satellite_height=satellite_height)
 
     # make a base map from cartopy
@@ -195,29 +376,39 @@ def plot_plate_motion(plate_boundary, epole_obj, center_lalo=None, qscale=200, q
 
     # add the plate polygon
     if plate_boundary:
-        poly_lats = np.array(plate_boundary.exterior.coords)[:, 0]
-        poly_lons = np.array(plate_boundary.exterior.coords)[:, 1]
-        ax.plot(poly_lons, poly_lats, color=kwargs['lc_pbond'], transform=ccrs.Geodetic(), linewidth=kwargs['lw_pbond'])
-        ax.fill(poly_lons, poly_lats, color=kwargs['c_plate'],  transform=ccrs.Geodetic(), alpha=kwargs['alpha_plate'])
+        # as one patch for both the boundary and the fill, to project the polygon only once
+        # (the polygon is in lat/lon, while cartopy expects lon/lat; alpha is for the fill only)
+        # (for plates around a pole, the boundary is drawn separately to skip the edges via the pole)
+        ax.add_geometries([plate_polygon], ccrs.PlateCarree(),
+                          facecolor=mcolors.to_rgba(kwargs['c_plate'], kwargs['alpha_plate']),
+                          edgecolor=kwargs['lc_pbond'] if pole_boundary is None else 'none',
+                          linewidth=kwargs['lw_pbond'])
+        if pole_boundary is not None:
+            ax.add_geometries([pole_boundary], ccrs.PlateCarree(),
+                              facecolor='none',
+                              edgecolor=kwargs['lc_pbond'],
+                              linewidth=kwargs['lw_pbond'])
 
         # compute the plate motion from Euler rotation
         if epole_obj:
             # select sample points inside the polygon
-            sample_lats, sample_lons = _sample_coords_within_polygon(plate_boundary, ny=kwargs['qnum'], nx=kwargs['qnum'])
+            # (on the drawn plate polygon back in lat/lon, i.e. with the unwrapped longitudes,
+            # then wrap the sample longitudes back into [-180, 180))
+            sample_coords = np.asarray(plate_polygon.exterior.coords)[:, ::-1]
+            sample_lats, sample_lons = _sample_coords_within_polygon(geometry.Polygon(sample_coords), sample_coords,
+                                                                     ny=kwargs['qnum'], nx=kwargs['qnum'])
+            sample_lons = (sample_lons + 180) % 360 - 180
 
             # calculate plate motion on sample points
             ve, vn = epole_obj.get_velocity_enu(lat=sample_lats, lon=sample_lons)[:2]
 
-            # scale from m/yr to mm/yr
-            ve *= 1e3
-            vn *= 1e3
-            norm = np.sqrt(ve**2 + vn**2)
-
             # correcting for "East" further toward polar region; re-normalize ve, vn
+            # and scale from m/yr to mm/yr, all via one scaling factor (in place)
+            norm = np.hypot(ve, vn)
             ve /= np.cos(np.deg2rad(sample_lats))
-            renorm = np.sqrt(ve**2 + vn**2)/norm
-            ve /= renorm
-            vn /= renorm
+            scale = 1e3 * norm / np.hypot(ve, vn)
+            ve *= scale
+            vn *= scale
 
             # ---------- plot inplate vectors --------------
             q = ax.quiver(sample_lons, sample_lats, ve, vn,
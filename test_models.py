@@ -0,0 +1,17 @@
+"""Tests for the plate motion models in models.py."""
+
+import copy
+import pickle
+
+import pytest
+
+from models import GSRM_V21_PMM, ITRF2014_PMM, NNR_MORVEL56_PMM
+
+
+@pytest.mark.parametrize('pmm_dict', [ITRF2014_PMM, GSRM_V21_PMM, NNR_MORVEL56_PMM])
+def test_pmm_pickle_copy(pmm_dict):
+    # frozen plate records with __slots__ round trip as the namedtuples did
+    for pmm_copy in [pickle.loads(pickle.dumps(pmm_dict)), copy.deepcopy(pmm_dict)]:
+        assert pmm_copy == pmm_dict
+    for plate in pmm_dict.values():
+        assert copy.copy(plate) == plate
@@ -0,0 +1,85 @@
+"""Tests for the plate boundary utilities in plot_utils.py."""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import plot_utils
+from models import GSRM_V21_PMM, NNR_MORVEL56_PMM
+
+
+@pytest.mark.parametrize('pmm_name, pmm_dict', [('GSRM', GSRM_V21_PMM), ('MORVEL', NNR_MORVEL56_PMM)])
+def test_read_plate_outline_all_plates(pmm_name, pmm_dict):
+    # all plates at once
+    plot_utils._OUTLINES_CACHE.clear()
+    outlines = plot_utils.read_plate_outline(pmm_name)
+    assert set(outlines.keys()) == set(pmm_dict.keys())
+    for vertices in outlines.values():
+        assert vertices.ndim == 2 and vertices.shape[1] == 2
+        assert np.all(np.abs(vertices[:, 0]) <= 90)
+
+    # in-place changes on the returned vertices do not leak into the cache
+    vertices = outlines['Pacific']
+    vertices[:, 1] %= 360
+    assert not np.array_equal(plot_utils.read_plate_outline(pmm_name)['Pacific'], vertices)
+    outlines = plot_utils.read_plate_outline(pmm_name)
+
+    # one plate at a time, parsed from the file (w/o cache) and from the cache
+    for use_cache in [False, True]:
+        for plate_name, vertices in outlines.items():
+            if not use_cache:
+                plot_utils._OUTLINES_CACHE.clear()
+            coords = np.asarray(plot_utils.read_plate_outline(pmm_name, plate_name).exterior.coords)
+            assert np.array_equal(coords[:len(vertices)], vertices)
+
+
+def test_read_plate_outline_morvel_nubia():
+    # "nb" for Nubia vs. "NB" for North Bismarck in the MORVEL boundary file
+    outlines = plot_utils.read_plate_outline('MORVEL')
+    assert not np.array_equal(outlines['Nubia'], outlines['NorthBismarck'])
+    assert plot_utils.read_plate_outline('MORVEL', 'Nubia').bounds[0] < -30
+
+
+def test_read_plate_outline_unknown_plate():
+    with pytest.raises(ValueError):
+        plot_utils.read_plate_outline('GSRM', 'Atlantis')
+
+
+def test_contains_points():
+    # compiled ray casting test vs. shapely, on the GSRM plates
+    pytest.importorskip('numba')
+    shapely = pytest.importorskip('shapely', minversion='2.0')
+    contains_points = plot_utils._get_contains_points()
+    rng = np.random.default_rng(0)
+    for plate_name in plot_utils.read_plate_outline('GSRM').keys():
+        polygon = plot_utils.read_plate_outline('GSRM', plate_name)
+        min_lat, min_lon, max_lat, max_lon = polygon.bounds
+        pts = np.column_stack([rng.uniform(min_lat, max_lat, 2000), rng.uniform(min_lon, max_lon, 2000)])
+        flag = np.zeros(pts.shape[0], dtype=np.bool_)
+        contains_points(np.asarray(polygon.exterior.coords), pts, flag)
+        assert np.array_equal(flag, shapely.contains_xy(polygon, pts[:, 0], pts[:, 1])), plate_name
+
+
+def test_import_without_numba():
+    # numba is imported on demand only, not by "import plot_utils"
+    code = 'import sys, plot_utils; assert "numba" not in sys.modules'
+    subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+
+
+def test_polygon_lalo2lola():
+    # plate across the antimeridian: unwrapped longitudes, valid polygon, no edges via the pole
+    coords = np.asarray(plot_utils.read_plate_outline('GSRM', 'Bering').exterior.coords)
+    polygon, boundary = plot_utils._polygon_lalo2lola(coords)
+    min_lon, _, max_lon, _ = polygon.bounds
+    assert polygon.is_valid and max_lon - min_lon < 360
+    assert boundary is None
+
+    # plate around the south pole: closed via -90 deg, with the boundary w/o the edges via the pole
+    coords = np.asarray(plot_utils.read_plate_outline('GSRM', 'Antarctica').exterior.coords)
+    polygon, boundary = plot_utils._polygon_lalo2lola(coords)
+    assert polygon.bounds[1] == -90
+    assert boundary is not None and boundary.bounds[1] > -90
+    assert np.array_equal(np.asarray(boundary.coords)[:, 1], coords[:, 0])